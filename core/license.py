@@ -2,7 +2,7 @@
 import re
 import hashlib
 from datetime import datetime, timedelta
-from typing import Optional, Literal
+from typing import Dict, Optional, Literal
 from core.logger import Logger
 from core.branding import Branding
 from utils.registry_utils import RegistryUtils
@@ -63,6 +63,10 @@ class LicenseManager:
         """Write value to registry."""
         return RegistryUtils.write_registry_value(self.REGISTRY_PATH, value_name, value)
     
+    def _write_registry_values(self, values: Dict[str, str]) -> bool:
+        """Write several values to registry."""
+        return RegistryUtils.write_registry_values(self.REGISTRY_PATH, values)
+    
     def _validate_license_key(self, key: str) -> bool:
         """
         Validate license key using strong algorithm-based checksum.
@@ -235,17 +239,15 @@ class LicenseManager:
         if not self._validate_license_key(key):
             return False, "Invalid license key format or validation failed."
         
-        # Store license key
+        # Store license key, activation timestamp and status in one registry write
         normalized_key = key.replace('-', '').upper()
-        if not self._write_registry(self.REG_LICENSE_KEY, normalized_key):
-            return False, "Failed to save license key to registry."
-        
-        # Store activation timestamp
         activated_at = datetime.now().isoformat()
-        self._write_registry(self.REG_ACTIVATED_AT, activated_at)
-        
-        # Update status
-        self._write_registry(self.REG_LICENSE_STATUS, "license_active")
+        if not self._write_registry_values({
+            self.REG_LICENSE_KEY: normalized_key,
+            self.REG_ACTIVATED_AT: activated_at,
+            self.REG_LICENSE_STATUS: "license_active",
+        }):
+            return False, "Failed to save license key to registry."
         
         self.logger.info("License activated successfully")
         return True, "License activated successfully!"
@@ -337,7 +337,6 @@ class Theme:
     @classmethod
     def get_project_item_stylesheet(cls) -> str:
         """Get stylesheet for project items."""
-        bg_color = cls.BACKGROUND if cls.BACKGROUND else "palette(window)"
         return f"""
         ProjectItem {{
             border: 1px solid {cls.BORDER};
@@ -353,27 +352,23 @@ class Theme:
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 {cls.HOVER}, stop:1 {cls.SURFACE});
         }}
+        """
+    
+    @classmethod
+    def get_template_item_stylesheet(cls) -> str:
+        """Get stylesheet for template cards."""
+        return """
+        TemplateItem {
+            border: 2px solid #ddd;
+            border-radius: 8px;
+            background-color: white;
+            min-height: 150px;
+        }
         
-        ProjectItem QPushButton {{
-            background-color: {bg_color};
-            color: {cls.TEXT_PRIMARY};
-            border: 1px solid {cls.BORDER};
-            border-radius: 4px;
-            padding: 5px 14px;
-            font-weight: 500;
-        }}
-        
-        ProjectItem QPushButton:hover {{
-            background-color: {cls.PRIMARY};
-            color: white;
-            border-color: {cls.PRIMARY};
-            transform: scale(1.05);
-        }}
-        
-        ProjectItem QPushButton:pressed {{
-            background-color: {cls.ACCENT};
-            border-color: {cls.ACCENT};
-        }}
+        TemplateItem:hover {
+            border-color: #0078d4;
+            background-color: #f8f9fa;
+        }
         """
     
     @classmethod
@@ -3,7 +3,7 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 from ui.main_window import MainWindow
 from ui.license_dialog import LicenseDialog
 from core.branding import Branding
@@ -28,6 +28,9 @@ def main():
     app.setOrganizationName(Branding.ORGANIZATION_NAME)
     app.setApplicationVersion(Branding.APP_VERSION)
     
+    # Room for shared project icons and other cached pixmaps (KB)
+    QPixmapCache.setCacheLimit(20480)
+    
     # Set application icon
     icon_path = Branding.get_app_icon_path()
     if icon_path and icon_path.exists():
@@ -39,7 +42,8 @@ def main():
     
     # Apply global theme
     from core.theme import Theme
-    app.setStyleSheet(Theme.get_global_stylesheet())
+    # Card stylesheets are parsed once here rather than per widget
+    app.setStyleSheet(Theme.get_global_stylesheet() + Theme.get_template_item_stylesheet())
     
     # High DPI scaling is enabled by default in PyQt6
     # No need to set these attributes
@@ -1,7 +1,7 @@
 """Dashboard widget for Flutter Project Launcher Tool."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QScrollArea, QLabel, QMessageBox, QMenu, QProgressBar, QComboBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from core.commands import FlutterCommandThread
 from PyQt6.QtGui import QFont
 from services.project_service import ProjectService
@@ -15,6 +15,7 @@ from ui.project_refresh_thread import ProjectRefreshThread
 from core.logger import Logger
 from core.settings import Settings
 from pathlib import Path
+from collections import deque
 import subprocess
 import os
 from typing import Optional
@@ -23,6 +24,9 @@ from typing import Optional
 class DashboardWidget(QWidget):
     """Main dashboard showing projects and quick actions."""
     
+    # Number of project rows built per event loop pass
+    PROJECT_ITEM_BATCH_SIZE = 10
+    
     # Signals
     create_project_requested = pyqtSignal()
     settings_requested = pyqtSignal()
@@ -37,6 +41,11 @@ class DashboardWidget(QWidget):
         self.load_thread: Optional[ProjectLoadThread] = None
         self.refresh_thread: Optional[ProjectRefreshThread] = None
         self.project_items = []  # Store project items
+        # Rows are built a batch per event loop pass so large lists don't block the UI
+        self._pending_projects = deque()
+        self._item_loader = QTimer(self)
+        self._item_loader.setInterval(0)
+        self._item_loader.timeout.connect(self._create_pending_items)
         self.current_tag_filter: Optional[str] = None  # Current tag filter
         self._init_ui()
         self._load_projects()
@@ -103,6 +112,8 @@ class DashboardWidget(QWidget):
         """)
         
         self.projects_widget = QWidget()
+        # One shared stylesheet for all project rows
+        self.projects_widget.setStyleSheet(Theme.get_project_item_stylesheet())
         self.projects_layout = QVBoxLayout(self.projects_widget)
         self.projects_layout.setSpacing(12)
         self.projects_layout.setContentsMargins(5, 5, 5, 5)
@@ -159,23 +170,16 @@ class DashboardWidget(QWidget):
         if hasattr(self, 'refresh_btn'):
             self.refresh_btn.setEnabled(False)
         
-        # If refresh_versions is True, first load projects, then refresh them in parallel
+        # Load projects; if refresh_versions is True, refresh them in parallel afterwards
+        self.load_thread = ProjectLoadThread(refresh_versions=False)
+        self.load_thread.progress.connect(self._on_load_progress)
+        self.load_thread.project_loaded.connect(self._on_project_loaded)
         if refresh_versions:
-            # First load projects
-            self.load_thread = ProjectLoadThread(refresh_versions=False)
-            self.load_thread.progress.connect(self._on_load_progress)
-            self.load_thread.project_loaded.connect(self._on_project_loaded)
             self.load_thread.finished.connect(self._on_projects_loaded_for_refresh)
-            self.load_thread.error.connect(self._on_load_error)
-            self.load_thread.start()
         else:
-            # Just load projects normally
-            self.load_thread = ProjectLoadThread(refresh_versions=False)
-            self.load_thread.progress.connect(self._on_load_progress)
-            self.load_thread.project_loaded.connect(self._on_project_loaded)
             self.load_thread.finished.connect(self._on_projects_loaded)
-            self.load_thread.error.connect(self._on_load_error)
-            self.load_thread.start()
+        self.load_thread.error.connect(self._on_load_error)
+        self.load_thread.start()
     
     def _on_load_progress(self, message: str):
         """Handle loading progress updates."""
@@ -184,21 +188,7 @@ class DashboardWidget(QWidget):
     
     def _on_project_loaded(self, project_data: dict):
         """Handle single project loaded - add it to UI progressively."""
-        project_item = ProjectItem(project_data, self)
-        project_item.clicked.connect(self._on_project_selected)
-        project_item.run_clicked.connect(self._on_project_run)
-        project_item.open_clicked.connect(self._on_project_open)
-        project_item.build_apk_clicked.connect(self._on_build_apk_from_context)
-        project_item.build_bundle_clicked.connect(self._on_build_bundle_from_context)
-        project_item.view_details_clicked.connect(self._on_view_details_from_context)
-        project_item.open_vscode_clicked.connect(self._on_open_vscode_from_context)
-        project_item.open_android_studio_clicked.connect(self._on_open_android_studio_from_context)
-        project_item.copy_path_clicked.connect(self._on_copy_path_from_context)
-        project_item.manage_tags_clicked.connect(self._on_manage_tags_from_context)
-        project_item.remove_from_list_clicked.connect(self._on_remove_from_list_from_context)
-        
-        self.project_items.append(project_item)
-        self._add_project_item_to_layout(project_item)
+        self._queue_project_items([project_data])
     
     def _on_projects_loaded(self, projects: list):
         """Handle all projects loaded."""
@@ -215,16 +205,47 @@ class DashboardWidget(QWidget):
         
         self.logger.info(f"Loaded {len(projects)} project(s)")
     
+    def _queue_project_items(self, projects: list):
+        """Queue projects for display; their rows are built in batches."""
+        self._pending_projects.extend(projects)
+        if not self._item_loader.isActive():
+            self._item_loader.start()
+    
+    def _create_pending_items(self):
+        """Build the next batch of queued project rows."""
+        for _ in range(min(self.PROJECT_ITEM_BATCH_SIZE, len(self._pending_projects))):
+            project_item = self._create_project_item(self._pending_projects.popleft())
+            self.project_items.append(project_item)
+            self._add_project_item_to_layout(project_item)
+        if not self._pending_projects:
+            self._item_loader.stop()
+    
+    def _create_project_item(self, project_data: dict) -> ProjectItem:
+        """Create a project row wired to the dashboard's handlers."""
+        project_item = ProjectItem(project_data, self)
+        project_item.clicked.connect(self._on_project_selected)
+        project_item.run_clicked.connect(self._on_project_run)
+        project_item.open_clicked.connect(self._on_project_open)
+        project_item.build_apk_clicked.connect(self._on_build_apk_from_context)
+        project_item.build_bundle_clicked.connect(self._on_build_bundle_from_context)
+        project_item.view_details_clicked.connect(self._on_view_details_from_context)
+        project_item.open_vscode_clicked.connect(self._on_open_vscode_from_context)
+        project_item.open_android_studio_clicked.connect(self._on_open_android_studio_from_context)
+        project_item.copy_path_clicked.connect(self._on_copy_path_from_context)
+        project_item.manage_tags_clicked.connect(self._on_manage_tags_from_context)
+        project_item.remove_from_list_clicked.connect(self._on_remove_from_list_from_context)
+        return project_item
+    
     def _clear_projects_layout(self):
         """Clear all project items from layout."""
+        self._pending_projects.clear()
+        self._item_loader.stop()
         self.project_items.clear()
-        # Clear layout
-        while self.projects_layout.count():
+        # Clear layout, keeping the trailing stretch item in place
+        while self.projects_layout.count() > 1:
             item = self.projects_layout.takeAt(0)
             if item.widget():
                 item.widget().setParent(None)
-        # Add stretch back
-        self.projects_layout.addStretch()
     
     def _add_project_item_to_layout(self, project_item: ProjectItem):
         """Add project item to layout."""
@@ -281,22 +302,7 @@ class DashboardWidget(QWidget):
             self.projects_layout.insertWidget(0, no_projects)
         else:
             # Add filtered projects
-            for project_data in projects:
-                project_item = ProjectItem(project_data, self)
-                project_item.clicked.connect(self._on_project_selected)
-                project_item.run_clicked.connect(self._on_project_run)
-                project_item.open_clicked.connect(self._on_project_open)
-                project_item.build_apk_clicked.connect(self._on_build_apk_from_context)
-                project_item.build_bundle_clicked.connect(self._on_build_bundle_from_context)
-                project_item.view_details_clicked.connect(self._on_view_details_from_context)
-                project_item.open_vscode_clicked.connect(self._on_open_vscode_from_context)
-                project_item.open_android_studio_clicked.connect(self._on_open_android_studio_from_context)
-                project_item.copy_path_clicked.connect(self._on_copy_path_from_context)
-                project_item.manage_tags_clicked.connect(self._on_manage_tags_from_context)
-                project_item.remove_from_list_clicked.connect(self._on_remove_from_list_from_context)
-                
-                self.project_items.append(project_item)
-                self._add_project_item_to_layout(project_item)
+            self._queue_project_items(projects)
         
         self.logger.info(f"Displayed {len(projects)} filtered project(s)")
     
@@ -323,21 +329,7 @@ class DashboardWidget(QWidget):
     def _on_project_refreshed(self, project_data: dict):
         """Handle single project refreshed - add to UI."""
         # Add refreshed project to UI
-        project_item = ProjectItem(project_data, self)
-        project_item.clicked.connect(self._on_project_selected)
-        project_item.run_clicked.connect(self._on_project_run)
-        project_item.open_clicked.connect(self._on_project_open)
-        project_item.build_apk_clicked.connect(self._on_build_apk_from_context)
-        project_item.build_bundle_clicked.connect(self._on_build_bundle_from_context)
-        project_item.view_details_clicked.connect(self._on_view_details_from_context)
-        project_item.open_vscode_clicked.connect(self._on_open_vscode_from_context)
-        project_item.open_android_studio_clicked.connect(self._on_open_android_studio_from_context)
-        project_item.copy_path_clicked.connect(self._on_copy_path_from_context)
-        project_item.manage_tags_clicked.connect(self._on_manage_tags_from_context)
-        project_item.remove_from_list_clicked.connect(self._on_remove_from_list_from_context)
-        
-        self.project_items.append(project_item)
-        self._add_project_item_to_layout(project_item)
+        self._queue_project_items([project_data])
     
     def _on_refresh_finished(self, projects: list):
         """Handle refresh finished."""
@@ -1,6 +1,7 @@
 """Background thread for loading projects list."""
 from PyQt6.QtCore import QThread, pyqtSignal
 from services.project_service import ProjectService
+from widgets.project_item import ProjectItem
 from typing import List, Dict, Any
 
 
@@ -41,17 +42,20 @@ class ProjectLoadThread(QThread):
                             project_data.update(updated_metadata)
                             # Save updated project
                             self.project_service.add_project(project_path)
-                            updated_projects.append(project_data)
-                            # Emit each project as it's loaded
-                            self.project_loaded.emit(project_data)
                         except Exception as e:
                             # Continue with original data if refresh fails
-                            updated_projects.append(project_data)
-                            self.project_loaded.emit(project_data)
+                            pass
+                        # Outside the try, so a failure here cannot add the row twice
+                        ProjectItem.preload(project_data)
+                        updated_projects.append(project_data)
+                        # Emit each project as it's loaded
+                        self.project_loaded.emit(project_data)
                 projects = updated_projects
             else:
                 # Emit projects one by one for progressive loading
                 for project_data in projects:
+                    # Decode icons and format metadata here rather than on the GUI thread
+                    ProjectItem.preload(project_data)
                     self.project_loaded.emit(project_data)
             
             self.progress.emit(f"Loaded {len(projects)} project(s)")
@@ -1,6 +1,7 @@
 """Background thread for refreshing project versions in parallel."""
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QWaitCondition
 from services.project_service import ProjectService
+from widgets.project_item import ProjectItem
 from typing import List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
@@ -33,10 +34,12 @@ class ProjectRefreshThread(QThread):
             project_data.update(updated_metadata)
             # Save updated project
             self.project_service.add_project(project_path)
-            return project_data
         except Exception as e:
-            # Return original data if refresh fails
-            return project_data
+            # Keep the original data if refresh fails
+            pass
+        # Decode the icon and format metadata on this worker rather than on the GUI thread
+        ProjectItem.preload(project_data)
+        return project_data
     
     def run(self):
         """Execute parallel project refreshing."""
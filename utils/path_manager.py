@@ -1,18 +1,58 @@
 """Environment PATH management utilities for Flutter Project Launcher Tool."""
 import os
+import re
+import sys
 import platform
+import shutil
+import tempfile
 from pathlib import Path
 from typing import List, Optional
 from core.logger import Logger
 import subprocess
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    import winreg
+
+    # SendMessageTimeoutW prototype, declared once; lpdwResult is a DWORD_PTR
+    _SendMessageTimeoutW = ctypes.windll.user32.SendMessageTimeoutW
+    _SendMessageTimeoutW.argtypes = [
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPCWSTR,
+        wintypes.UINT, wintypes.UINT, ctypes.POINTER(ctypes.c_size_t)
+    ]
+    _SendMessageTimeoutW.restype = wintypes.LPARAM
+
 
 class PathManager:
     """Cross-platform PATH management."""
     
+    # Win32 constants for broadcasting environment changes
+    HWND_BROADCAST = 0xFFFF
+    WM_SETTINGCHANGE = 0x001A
+    SMTO_ABORTIFHUNG = 0x0002
+    BROADCAST_TIMEOUT_MS = 5000
+    
+    # Shell config file by shell executable name
+    SHELL_CONFIG_FILES = {"zsh": ".zshrc", "bash": ".bashrc"}
+    
+    # Matches `export PATH=...` lines in shell config files
+    EXPORT_PATH_RE = re.compile(r'^(\s*export\s+PATH=)(["\']?)(.*?)\2\s*$')
+    
     def __init__(self):
         self.logger = Logger()
         self.system = platform.system()
+        
+        # Resolve platform-specific implementations once
+        if self.system == "Windows":
+            self._add_impl = self._add_to_path_windows
+            self._remove_impl = self._remove_from_path_windows
+        elif self.system in ("Linux", "Darwin"):
+            self._add_impl = self._add_to_path_unix
+            self._remove_impl = self._remove_from_path_unix
+        else:
+            self._add_impl = None
+            self._remove_impl = None
     
     def add_to_path(self, path: str, user_only: bool = True) -> bool:
         """
@@ -25,41 +65,48 @@ class PathManager:
         Returns:
             True if successful
         """
-        try:
-            if self.system == "Windows":
-                return self._add_to_path_windows(path, user_only)
-            elif self.system in ["Linux", "Darwin"]:
-                return self._add_to_path_unix(path, user_only)
+        if self._add_impl is None:
             return False
+        try:
+            path_str = str(Path(path).resolve())
+            return self._add_impl(path_str, user_only)
         except Exception as e:
             self.logger.error(f"Error adding to PATH: {e}")
             return False
     
     def remove_from_path(self, path: str) -> bool:
         """Remove path from system PATH."""
-        try:
-            if self.system == "Windows":
-                return self._remove_from_path_windows(path)
-            elif self.system in ["Linux", "Darwin"]:
-                return self._remove_from_path_unix(path)
+        if self._remove_impl is None:
             return False
+        try:
+            path_str = str(Path(path).resolve())
+            return self._remove_impl(path_str)
         except Exception as e:
             self.logger.error(f"Error removing from PATH: {e}")
             return False
     
     def is_in_path(self, path: str) -> bool:
         """Check if path is in system PATH."""
-        current_path = os.environ.get("PATH", "")
         path_str = str(Path(path).resolve())
-        return path_str in current_path or path in current_path
+        return self._is_in_current_path(path_str, path)
+    
+    def _is_in_current_path(self, *paths: str) -> bool:
+        """Check if any of the given path strings is an entry of the current PATH."""
+        path_entries = self._path_entry_set(os.environ.get("PATH", ""))
+        return any(self._normalize_path_entry(p) in path_entries for p in paths)
+    
+    @staticmethod
+    def _normalize_path_entry(path_str: str) -> str:
+        """Normalize a PATH entry for comparison (case-insensitive on Windows)."""
+        return os.path.normcase(os.path.normpath(path_str))
+    
+    def _path_entry_set(self, path_value: str) -> set:
+        """Split a PATH value into a set of normalized entries."""
+        return {self._normalize_path_entry(p) for p in path_value.split(os.pathsep) if p}
     
-    def _add_to_path_windows(self, path: str, user_only: bool) -> bool:
-        """Add path to Windows PATH."""
+    def _add_to_path_windows(self, path_str: str, user_only: bool) -> bool:
+        """Add resolved path to Windows PATH."""
         try:
-            import winreg
-            
-            path_str = str(Path(path).resolve())
-            
             # Get current PATH
             if user_only:
                 key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_READ | winreg.KEY_WRITE)
@@ -74,8 +121,8 @@ class PathManager:
                 current_path = ""
             
             # Check if already in PATH
-            path_entries = current_path.split(os.pathsep) if current_path else []
-            if path_str in path_entries:
+            if self._normalize_path_entry(path_str) in self._path_entry_set(current_path):
+                winreg.CloseKey(key)
                 return True  # Already in PATH
             
             # Add to PATH
@@ -84,8 +131,7 @@ class PathManager:
             winreg.CloseKey(key)
             
             # Broadcast environment change
-            import ctypes
-            ctypes.windll.user32.SendMessageW(0xFFFF, 0x001A, 0, "Environment")
+            self._broadcast_environment_change()
             
             self.logger.info(f"Added {path_str} to PATH")
             return True
@@ -94,25 +140,22 @@ class PathManager:
             self.logger.error(f"Windows PATH update failed: {e}")
             return False
     
-    def _remove_from_path_windows(self, path: str) -> bool:
-        """Remove path from Windows PATH."""
+    def _remove_from_path_windows(self, path_str: str) -> bool:
+        """Remove resolved path from Windows PATH."""
         try:
-            import winreg
-            
-            path_str = str(Path(path).resolve())
-            
             # Try user PATH first
             try:
                 key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_READ | winreg.KEY_WRITE)
                 current_path, _ = winreg.QueryValueEx(key, "Path")
-                path_entries = [p for p in current_path.split(os.pathsep) if p and p != path_str]
+                path_key = self._normalize_path_entry(path_str)
+                path_entries = [p for p in current_path.split(os.pathsep)
+                                if p and self._normalize_path_entry(p) != path_key]
                 new_path = os.pathsep.join(path_entries)
                 winreg.SetValueEx(key, "Path", 0, winreg.REG_EXPAND_SZ, new_path)
                 winreg.CloseKey(key)
                 
                 # Broadcast environment change
-                import ctypes
-                ctypes.windll.user32.SendMessageW(0x001A, 0x001A, 0, "Environment")
+                self._broadcast_environment_change()
                 
                 self.logger.info(f"Removed {path_str} from PATH")
                 return True
@@ -125,17 +168,24 @@ class PathManager:
             self.logger.error(f"Windows PATH removal failed: {e}")
             return False
     
-    def _add_to_path_unix(self, path: str, user_only: bool) -> bool:
-        """Add path to Unix-like system PATH."""
+    def _broadcast_environment_change(self):
+        """Notify top-level windows that the environment changed without blocking on hung ones."""
+        result = ctypes.c_size_t()  # DWORD_PTR, pointer-sized on 64-bit Windows
+        _SendMessageTimeoutW(
+            self.HWND_BROADCAST, self.WM_SETTINGCHANGE, 0, "Environment",
+            self.SMTO_ABORTIFHUNG, self.BROADCAST_TIMEOUT_MS, ctypes.byref(result)
+        )
+    
+    def _add_to_path_unix(self, path_str: str, user_only: bool) -> bool:
+        """Add resolved path to Unix-like system PATH."""
         try:
-            path_str = str(Path(path).resolve())
             shell_config = self._get_shell_config()
             
             if not shell_config:
                 return False
             
             # Check if already in PATH
-            if self.is_in_path(path_str):
+            if self._is_in_current_path(path_str):
                 return True
             
             # Add to shell config
@@ -151,10 +201,9 @@ class PathManager:
             self.logger.error(f"Unix PATH update failed: {e}")
             return False
     
-    def _remove_from_path_unix(self, path: str) -> bool:
-        """Remove path from Unix-like system PATH."""
+    def _remove_from_path_unix(self, path_str: str) -> bool:
+        """Remove resolved path from Unix-like system PATH."""
         try:
-            path_str = str(Path(path).resolve())
             shell_config = self._get_shell_config()
             
             if not shell_config or not os.path.exists(shell_config):
@@ -164,12 +213,27 @@ class PathManager:
             with open(shell_config, 'r') as f:
                 lines = f.readlines()
             
-            # Remove lines containing this path
-            new_lines = [line for line in lines if path_str not in line]
+            # Drop this path from `export PATH=...` lines only, leaving everything else verbatim
+            new_lines = []
+            for line in lines:
+                match = self.EXPORT_PATH_RE.match(line)
+                if not match:
+                    new_lines.append(line)
+                    continue
+                prefix, quote, value = match.groups()
+                entries = value.split(":")
+                if path_str not in entries:
+                    new_lines.append(line)
+                    continue
+                entries = [entry for entry in entries if entry != path_str]
+                if entries == ["$PATH"] or not entries:
+                    continue  # Line only existed to add this path
+                new_lines.append(f"{prefix}{quote}{':'.join(entries)}{quote}\n")
             
-            # Write back
-            with open(shell_config, 'w') as f:
-                f.writelines(new_lines)
+            if new_lines == lines:
+                return True  # Path wasn't in any export line
+            
+            self._replace_file_atomic(shell_config, new_lines)
             
             self.logger.info(f"Removed {path_str} from PATH in {shell_config}")
             return True
@@ -178,15 +242,34 @@ class PathManager:
             self.logger.error(f"Unix PATH removal failed: {e}")
             return False
     
+    def _replace_file_atomic(self, file_path: str, lines: List[str]):
+        """Replace a file's contents atomically, keeping its mode and any symlink to it."""
+        # Write next to the real file so a symlinked dotfile keeps its link and os.replace stays on one filesystem
+        real_path = os.path.realpath(file_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(real_path),
+                                        prefix=os.path.basename(real_path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(real_path, tmp_path)
+            os.replace(tmp_path, real_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def _get_shell_config(self) -> Optional[str]:
         """Get shell configuration file path."""
-        shell = os.environ.get("SHELL", "")
+        shell_name = os.path.basename(os.environ.get("SHELL", ""))
         home = Path.home()
         
-        if "zsh" in shell:
-            return str(home / ".zshrc")
-        elif "bash" in shell:
-            return str(home / ".bashrc")
+        config_name = self.SHELL_CONFIG_FILES.get(shell_name)
+        if config_name:
+            return str(home / config_name)
         else:
             # Default to .bashrc
             bashrc = home / ".bashrc"
@@ -1,9 +1,12 @@
 """Windows Registry utilities for FluStudio."""
 import sys
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
 from core.logger import Logger
 
+if sys.platform == "win32":
+    import winreg
+
 
 class RegistryUtils:
     """Windows Registry helper utilities."""
@@ -39,8 +42,6 @@ class RegistryUtils:
             return None
         
         try:
-            import winreg
-            
             # Open registry key (HKEY_CURRENT_USER)
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -86,8 +87,6 @@ class RegistryUtils:
             return False
         
         try:
-            import winreg
-            
             # Create key if it doesn't exist
             key = winreg.CreateKey(
                 winreg.HKEY_CURRENT_USER,
@@ -107,6 +106,43 @@ class RegistryUtils:
             cls._get_logger().error(f"Error creating registry key: {e}")
             return False
     
+    @classmethod
+    def write_registry_values(cls, key_path: str, values: Dict[str, str]) -> bool:
+        """
+        Write several values to Windows Registry under a single open key.
+        
+        Args:
+            key_path: Registry key path
+            values: Mapping of value name to value
+        
+        Returns:
+            True if all values were written, False otherwise
+        """
+        if not cls.is_windows():
+            cls._get_logger().warning("Registry access only available on Windows")
+            return False
+        
+        try:
+            # Create key if it doesn't exist
+            key = winreg.CreateKey(
+                winreg.HKEY_CURRENT_USER,
+                key_path
+            )
+            
+            try:
+                for value_name, value in values.items():
+                    winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, str(value))
+                winreg.CloseKey(key)
+                return True
+            except Exception as e:
+                winreg.CloseKey(key)
+                cls._get_logger().error(f"Error writing registry values: {e}")
+                return False
+        
+        except Exception as e:
+            cls._get_logger().error(f"Error creating registry key: {e}")
+            return False
+    
     @classmethod
     def delete_registry_value(cls, key_path: str, value_name: str) -> bool:
         """
@@ -124,8 +160,6 @@ class RegistryUtils:
             return False
         
         try:
-            import winreg
-            
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 key_path,
@@ -167,8 +201,6 @@ class RegistryUtils:
             return False
         
         try:
-            import winreg
-            
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 key_path,
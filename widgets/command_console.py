@@ -1,24 +1,37 @@
 """Command console widget for Flutter Project Launcher Tool."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QPlainTextEdit, QPushButton, 
                              QHBoxLayout, QMenu, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QRegularExpression, QThread, pyqtSignal
 from PyQt6.QtGui import (QTextCharFormat, QColor, QTextCursor, QSyntaxHighlighter, 
                         QTextDocument, QKeySequence, QShortcut, QAction)
 from typing import Optional
-import re
 from datetime import datetime
 
 
 class LogSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for Flutter console logs."""
     
+    # Blocks longer than this are left unformatted to keep repaints responsive
+    MAX_HIGHLIGHT_LENGTH = 2000
+    
+    # Compiled rules shared by every highlighter instance (built on first use)
+    _shared_rules = None
+    
     def __init__(self, parent: Optional[QTextDocument] = None):
         super().__init__(parent)
-        self._setup_rules()
+        self.highlighting_rules = self._get_rules()
+    
+    @classmethod
+    def _get_rules(cls) -> list:
+        """Get compiled highlighting rules, building them once per process."""
+        if cls._shared_rules is None:
+            cls._shared_rules = cls._compile_rules(cls._setup_rules())
+        return cls._shared_rules
     
-    def _setup_rules(self):
+    @staticmethod
+    def _setup_rules() -> list:
         """Setup syntax highlighting rules."""
-        self.highlighting_rules = []
+        rules = []
         
         # Error patterns
         error_patterns = [
@@ -31,7 +44,7 @@ class LogSyntaxHighlighter(QSyntaxHighlighter):
         error_format.setForeground(QColor(220, 50, 47))  # Red
         error_format.setFontWeight(600)
         for pattern in error_patterns:
-            self.highlighting_rules.append((pattern, error_format))
+            rules.append((pattern, error_format))
         
         # Warning patterns
         warning_patterns = [
@@ -42,7 +55,7 @@ class LogSyntaxHighlighter(QSyntaxHighlighter):
         warning_format = QTextCharFormat()
         warning_format.setForeground(QColor(203, 75, 22))  # Orange
         for pattern in warning_patterns:
-            self.highlighting_rules.append((pattern, warning_format))
+            rules.append((pattern, warning_format))
         
         # Success patterns
         success_patterns = [
@@ -54,44 +67,83 @@ class LogSyntaxHighlighter(QSyntaxHighlighter):
         success_format = QTextCharFormat()
         success_format.setForeground(QColor(133, 153, 0))  # Green
         for pattern in success_patterns:
-            self.highlighting_rules.append((pattern, success_format))
+            rules.append((pattern, success_format))
         
         # Flutter command patterns
         flutter_format = QTextCharFormat()
         flutter_format.setForeground(QColor(97, 175, 239))  # Blue
         flutter_format.setFontWeight(500)
-        self.highlighting_rules.append((r'\bflutter\s+\w+', flutter_format))
-        self.highlighting_rules.append((r'\bfvm\s+\w+', flutter_format))
+        rules.append((r'\bflutter\s+\w+', flutter_format))
+        rules.append((r'\bfvm\s+\w+', flutter_format))
         
         # Version numbers
         version_format = QTextCharFormat()
         version_format.setForeground(QColor(152, 195, 121))  # Light green
-        self.highlighting_rules.append((r'\b\d+\.\d+\.\d+', version_format))
+        rules.append((r'\b\d+\.\d+\.\d+\b', version_format))
         
         # File paths (Windows and Unix)
         path_format = QTextCharFormat()
         path_format.setForeground(QColor(209, 154, 102))  # Brown/orange
-        self.highlighting_rules.append((r'[A-Z]:\\[^\s]+', path_format))  # Windows paths
-        self.highlighting_rules.append((r'/[\w/\.-]+', path_format))  # Unix paths
+        rules.append((r'\b[A-Z]:\\\S+', path_format))  # Windows paths
+        rules.append((r'(?<![\w/])/[\w/.\-]+', path_format))  # Unix paths
         
         # URLs
         url_format = QTextCharFormat()
         url_format.setForeground(QColor(86, 182, 194))  # Cyan
         url_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
-        self.highlighting_rules.append((r'https?://[^\s]+', url_format))
+        rules.append((r'\bhttps?://\S+', url_format))
         
         # Timestamps
         timestamp_format = QTextCharFormat()
         timestamp_format.setForeground(QColor(127, 132, 142))  # Gray
-        self.highlighting_rules.append((r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', timestamp_format))
+        rules.append((r'\b\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', timestamp_format))
+        
+        return rules
+    
+    @staticmethod
+    def _compile_rules(rules: list) -> list:
+        """Compile highlighting patterns into JIT-optimized Qt regular expressions."""
+        options = QRegularExpression.PatternOption.CaseInsensitiveOption
+        compiled_rules = []
+        for pattern, format in rules:
+            expression = QRegularExpression(pattern, options)
+            expression.optimize()
+            compiled_rules.append((expression, format))
+        return compiled_rules
     
     def highlightBlock(self, text: str):
         """Apply syntax highlighting to a block of text."""
-        for pattern, format in self.highlighting_rules:
-            expression = re.compile(pattern, re.IGNORECASE)
-            for match in expression.finditer(text):
-                start, end = match.span()
-                self.setFormat(start, end - start, format)
+        # Skip giant single-line dumps and blocks no rule can meaningfully match
+        if not text or len(text) > self.MAX_HIGHLIGHT_LENGTH:
+            return
+        stripped = text.strip()
+        if not stripped or stripped.isdigit():
+            return
+        
+        for expression, format in self.highlighting_rules:
+            iterator = expression.globalMatch(text)
+            while iterator.hasNext():
+                match = iterator.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+
+
+class LogExportThread(QThread):
+    """Thread for writing exported console logs to disk."""
+    finished = pyqtSignal(bool, str)  # success, file path or error message
+    
+    def __init__(self, file_path: str, text: str):
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+    
+    def run(self):
+        """Write log text to file."""
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                f.write(self.text)
+            self.finished.emit(True, self.file_path)
+        except Exception as e:
+            self.finished.emit(False, str(e))
 
 
 class CommandConsole(QWidget):
@@ -104,6 +156,7 @@ class CommandConsole(QWidget):
         self._setup_context_menu()
         self._setup_shortcuts()
         self.auto_scroll_enabled = True
+        self._export_thread = None
     
     def _init_ui(self):
         """Initialize UI components."""
@@ -210,6 +263,7 @@ class CommandConsole(QWidget):
         
         # Export action
         export_action = QAction("💾 Export Log...", self)
+        export_action.setEnabled(not self._is_exporting())
         export_action.triggered.connect(self.export_log)
         menu.addAction(export_action)
         
@@ -258,9 +312,10 @@ class CommandConsole(QWidget):
         elif is_info:
             cursor.setCharFormat(self.info_format)
         
+        # Insert through a detached cursor; moving the widget's own cursor would
+        # trigger cursor/selection updates on every line
         cursor.insertText(text)
         cursor.insertText("\n")
-        self.console.setTextCursor(cursor)
         
         # Auto-scroll to bottom
         QTimer.singleShot(10, self._auto_scroll)  # Small delay for better performance
@@ -303,8 +358,15 @@ class CommandConsole(QWidget):
             QApplication.clipboard().setText(text)
             self.append_info("All text copied to clipboard")
     
+    def _is_exporting(self) -> bool:
+        """Check whether a log export is still being written."""
+        return self._export_thread is not None and self._export_thread.isRunning()
+    
     def export_log(self):
         """Export log to file."""
+        if self._is_exporting():
+            return  # Keep the running export thread referenced until it finishes
+        
         from PyQt6.QtWidgets import QFileDialog
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"flutter_log_{timestamp}.txt"
@@ -317,12 +379,19 @@ class CommandConsole(QWidget):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.console.toPlainText())
-                self.append_success(f"✓ Log exported to: {file_path}")
-            except Exception as e:
-                self.append_error(f"✗ Error exporting log: {e}")
+            # Snapshot text on the UI thread, write it in the background
+            self.export_btn.setEnabled(False)
+            self._export_thread = LogExportThread(file_path, self.console.toPlainText())
+            self._export_thread.finished.connect(self._on_export_finished)
+            self._export_thread.start()
+    
+    def _on_export_finished(self, success: bool, message: str):
+        """Handle log export completion."""
+        self.export_btn.setEnabled(True)
+        if success:
+            self.append_success(f"✓ Log exported to: {message}")
+        else:
+            self.append_error(f"✗ Error exporting log: {message}")
     
     def save_log(self):
         """Alias for export_log (backward compatibility)."""
@@ -1,9 +1,111 @@
 """Project item widget for Flutter Project Launcher Tool."""
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QMenu
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPixmap, QIcon
-from pathlib import Path
-from typing import Dict, Any, Optional
+from PyQt6.QtWidgets import QApplication, QWidget, QMenu, QSizePolicy, QStyle, QStyleOption, QToolTip
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QSize, QRect, QRectF, QPointF
+from PyQt6.QtGui import (QFont, QFontMetrics, QPixmap, QPixmapCache, QPainter, QPen, QColor, QPalette,
+                         QImage, QStaticText, QTransform)
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+import os
+import re
+from core.theme import Theme
+
+_FLUTTER_VERSION_RE = re.compile(r'Flutter\s+([\d.]+)')
+
+
+def _format_path(path: str) -> str:
+    """Format a project path for display with forward slashes."""
+    return path.replace("\\", "/") if path else "No path"
+
+
+def _format_modified(last_modified: Optional[str]) -> str:
+    """Format an ISO last-modified timestamp for display, or "" if missing or invalid."""
+    if not last_modified:
+        return ""
+    try:
+        return datetime.fromisoformat(last_modified).strftime('%Y-%m-%d %H:%M')
+    except (TypeError, ValueError):
+        return ""
+
+
+def _format_sdk(flutter_version: Optional[str], flutter_constraint: Optional[str]) -> str:
+    """Format the Flutter SDK line from a detected version or a pubspec constraint."""
+    if flutter_version:
+        # Extract just the version number if it contains "Flutter"
+        version_display = flutter_version
+        if "Flutter" in flutter_version:
+            version_match = _FLUTTER_VERSION_RE.search(flutter_version)
+            if version_match:
+                version_display = f"v{version_match.group(1)}"
+            else:
+                version_display = flutter_version.replace("Flutter", "").strip()
+        return f"🔧 SDK: {version_display}"
+    if flutter_constraint:
+        return f"🔧 SDK Constraint: {flutter_constraint}"
+    return "🔧 SDK: Unknown"
+
+
+def _cached_display(project_data: Dict[str, Any], key: str, source: tuple, build) -> str:
+    """Get a display string cached on project_data under key.
+    
+    The cache remembers the source values it was built from, so it is rebuilt
+    when a refresh updates the project dict in place.
+    """
+    cached = project_data.get(key)
+    if cached is None or cached[0] != source:
+        cached = (source, build(*source))
+        project_data[key] = cached
+    return cached[1]
+
+
+def _format_display_strings(project_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Get the (path, last modified, SDK line) display strings for a project, formatting them once."""
+    get = project_data.get
+    return (
+        _cached_display(project_data, "_path_display", (get("path", ""),), _format_path),
+        _cached_display(project_data, "_last_modified_display", (get("last_modified"),), _format_modified),
+        _cached_display(project_data, "_flutter_version_display",
+                        (get("flutter_version"), get("flutter_sdk_constraint")), _format_sdk),
+    )
+
+
+def _load_icon_image(icon_path: str, size: int) -> Optional[QImage]:
+    """Decode a project icon scaled to size. QImage is safe to use off the GUI thread.
+    
+    Returns None if the icon can't be read.
+    """
+    image = QImage(icon_path)
+    if image.isNull():
+        return None
+    # Smooth filtering only pays off for large downscales; near the target size
+    # nearest-neighbour scaling looks the same and is much cheaper
+    if image.width() > 2 * size or image.height() > 2 * size:
+        mode = Qt.TransformationMode.SmoothTransformation
+    else:
+        mode = Qt.TransformationMode.FastTransformation
+    return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+
+
+def _load_icon_pixmap(icon_path: str, size: int, image: Optional[QImage] = None) -> Optional[QPixmap]:
+    """Load a project icon scaled to size, shared between rows via QPixmapCache.
+    
+    image is the icon already decoded by ProjectItem.preload(), if any.
+    Returns None if the icon file is missing or unreadable.
+    """
+    try:
+        # Single stat: doubles as the existence check and the cache key
+        mtime = os.path.getmtime(icon_path)
+    except OSError:
+        return None
+    key = f"project_icon:{icon_path}:{mtime}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        if image is None:
+            image = _load_icon_image(icon_path, size)
+            if image is None:
+                return None
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class ProjectItem(QWidget):
@@ -22,256 +124,588 @@ class ProjectItem(QWidget):
     manage_tags_clicked = pyqtSignal(str)
     remove_from_list_clicked = pyqtSignal(str)
     
+    # Row geometry
+    MARGIN_X = 15
+    MARGIN_Y = 12
+    SPACING = 15
+    LINE_SPACING = 4
+    ICON_SIZE = 48  # Larger icon size
+    ICON_CONTAINER_SIZE = 52  # Container size with border
+    ICON_BORDER_WIDTH = 3
+    TEXT_WIDTH_HINT = 300
+    BUTTON_WIDTH = 90
+    BUTTON_SPACING = 8
+    BUTTON_PADDING_Y = 5
+    MAX_TAGS = 5
+    TAG_SPACING = 4
+    TAG_PADDING_X = 6
+    TAG_PADDING_Y = 2
+    
+    # Painted action buttons: (action, text, tooltip)
+    ACTION_BUTTONS = (
+        ("run", "▶ Run", "Run this Flutter project"),
+        ("open", "📂 Open", "Open project folder"),
+    )
+    
+    # Context menu entries: (action, text), None for a separator.
+    # Each action emits the matching <action>_clicked signal.
+    CONTEXT_MENU_ACTIONS = (
+        ("run", "▶ Run Project"),
+        None,
+        ("open", "📂 Open Folder"),
+        ("open_vscode", "📝 Open in VS Code"),
+        ("open_android_studio", "🛠 Open in Android Studio"),
+        None,
+        ("build_apk", "📦 Build APK"),
+        ("build_bundle", "🎁 Build Bundle"),
+        None,
+        ("view_details", "ℹ️ View Details"),
+        ("manage_tags", "🏷️ Manage Tags"),
+        None,
+        ("copy_path", "📋 Copy Path"),
+        ("remove_from_list", "🗑️ Remove from List"),
+    )
+    
+    _shared_fonts = None  # Built once per process, see _get_fonts()
+    _shared_button_labels = None  # Laid out once per process, see _get_button_labels()
+    
+    # Text layout flags for painted info lines
+    LINE_FLAGS = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    
     def __init__(self, project_data: Dict[str, Any], parent: Optional[QWidget] = None, is_grid_view: bool = False):
         super().__init__(parent)
         self.project_data = project_data
         self.project_path = project_data.get("path", "")
         self.is_grid_view = is_grid_view
+        self._cache: Optional[QPixmapCache.Key] = None  # Icon and text layer, see _rebuild_cache()
+        self._cache_key = None
+        self._hovered = False
+        self._context_menu: Optional[QMenu] = None  # Built on first right-click
+        self._static_lines: List[QStaticText] = []  # See _get_static_lines()
+        self._static_lines_width = -1
+        self._init_content()
         self._init_ui()
     
-    def _init_ui(self):
-        """Initialize UI components."""
-        from core.theme import Theme
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(15, 12, 15, 12)
-        layout.setSpacing(15)
-        
-        # Left side - Project icon (profile picture style)
-        icon_path = self.project_data.get("icon_path")
-        icon_size = 48  # Larger icon size
-        container_size = 52  # Container size with border
-        
-        if icon_path and Path(icon_path).exists():
+    def _init_content(self):
+        """Prepare the icon, fonts and text painted by this row."""
+        # Bind the dict and its get() once; every field below is read through them
+        project_data = self.project_data
+        get = project_data.get
+        
+        # Project icon (profile picture style)
+        self.icon_pixmap: Optional[QPixmap] = None
+        icon_path = get("icon_path")
+        if icon_path:
             try:
-                icon_label = QLabel(self)
-                pixmap = QPixmap(icon_path)
-                # Scale icon to smaller profile picture size
-                scaled_pixmap = pixmap.scaled(icon_size, icon_size, Qt.AspectRatioMode.KeepAspectRatio, 
-                                            Qt.TransformationMode.SmoothTransformation)
-                icon_label.setPixmap(scaled_pixmap)
-                icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                icon_label.setStyleSheet(f"""
-                    QLabel {{
-                        border: 3px solid {Theme.PRIMARY};
-                        border-radius: 26px;
-                        padding: 2px;
-                        background-color: {Theme.SURFACE};
-                    }}
-                """)
-                icon_label.setFixedSize(container_size, container_size)
-                layout.addWidget(icon_label)
+                # Scaled to profile picture size, cached across rows and refreshes
+                self.icon_pixmap = _load_icon_pixmap(icon_path, self.ICON_SIZE,
+                                                     project_data.pop("_icon_image", None))
             except Exception:
-                # If icon loading fails, show placeholder
-                placeholder = QLabel("📱", self)
-                placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                placeholder.setStyleSheet(f"""
-                    QLabel {{
-                        border: 3px solid {Theme.BORDER};
-                        border-radius: 26px;
-                        padding: 2px;
-                        background-color: {Theme.SURFACE};
-                        font-size: 24px;
-                    }}
-                """)
-                placeholder.setFixedSize(container_size, container_size)
-                layout.addWidget(placeholder)
-        else:
-            # Show placeholder icon if no icon found
-            placeholder = QLabel("📱", self)
-            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            from core.theme import Theme
-            placeholder.setStyleSheet(f"""
-                QLabel {{
-                    border: 3px solid {Theme.BORDER};
-                    border-radius: 26px;
-                    padding: 2px;
-                    background-color: {Theme.SURFACE};
-                    font-size: 24px;
-                }}
-            """)
-            placeholder.setFixedSize(container_size, container_size)
-            layout.addWidget(placeholder)
+                self.icon_pixmap = None  # Show placeholder instead
         
-        # Center - Project info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
+        fonts = self._get_fonts()
+        self.name_font = fonts["name"]
+        self.package_font = fonts["package"]
+        self.detail_font = fonts["detail"]
+        self.tag_font = fonts["tag"]
+        
+        # Info column lines: (text, font, color, elide mode); every line is a single elided line
+        self.text_lines = []
         
         # Project name
-        self.name_label = QLabel(self.project_data.get("name", "Unknown Project"), self)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(12)
-        self.name_label.setFont(name_font)
-        self.name_label.setStyleSheet(f"color: {Theme.TEXT_PRIMARY};")
-        info_layout.addWidget(self.name_label)
+        name = get("name")
+        self.text_lines.append((name if name is not None else "Unknown Project", self.name_font,
+                                Theme.TEXT_PRIMARY, Qt.TextElideMode.ElideRight))
         
         # Package name (from pubspec.yaml)
-        package_name = self.project_data.get("package_name") or self.project_data.get("name", "")
+        package_name = get("package_name") or name
         if package_name:
-            package_label = QLabel(f"📦 {package_name}", self)
-            package_label.setStyleSheet(f"color: {Theme.PRIMARY}; font-size: 9pt;")
-            info_layout.addWidget(package_label)
+            self.text_lines.append((f"📦 {package_name}", self.package_font, Theme.PRIMARY,
+                                    Qt.TextElideMode.ElideRight))
+        
+        path_display, modified_display, version_line = _format_display_strings(project_data)
         
-        # Project path
-        path = self.project_data.get("path", "")
-        path_display = Path(path).as_posix() if path else "No path"
-        self.path_label = QLabel(f"📁 {path_display}", self)
-        self.path_label.setStyleSheet(f"color: {Theme.TEXT_SECONDARY}; font-size: 8pt;")
-        self.path_label.setWordWrap(True)
-        info_layout.addWidget(self.path_label)
+        # Project path, elided in the middle so both the root and the project folder stay visible
+        self.text_lines.append((f"📁 {path_display}", self.detail_font, Theme.TEXT_SECONDARY,
+                                Qt.TextElideMode.ElideMiddle))
         
         # Metadata row 1: Last modified
         metadata_row1 = []
-        if self.project_data.get("last_modified"):
-            from datetime import datetime
-            try:
-                dt = datetime.fromisoformat(self.project_data["last_modified"])
-                metadata_row1.append(f"🕒 Modified: {dt.strftime('%Y-%m-%d %H:%M')}")
-            except:
-                pass
+        if modified_display:
+            metadata_row1.append(f"🕒 Modified: {modified_display}")
         
         # Metadata row 2: Flutter SDK version
-        metadata_row2 = []
-        flutter_version = self.project_data.get("flutter_version")
-        flutter_constraint = self.project_data.get("flutter_sdk_constraint")
-        
-        if flutter_version:
-            # Extract just the version number if it contains "Flutter"
-            version_display = flutter_version
-            if "Flutter" in flutter_version:
-                import re
-                version_match = re.search(r'Flutter\s+([\d.]+)', flutter_version)
-                if version_match:
-                    version_display = f"v{version_match.group(1)}"
-                else:
-                    version_display = flutter_version.replace("Flutter", "").strip()
-            metadata_row2.append(f"🔧 SDK: {version_display}")
-        elif flutter_constraint:
-            metadata_row2.append(f"🔧 SDK Constraint: {flutter_constraint}")
-        else:
-            metadata_row2.append("🔧 SDK: Unknown")
+        metadata_row2 = [version_line]
         
-        # Display metadata rows
-        if metadata_row1:
-            self.metadata_label1 = QLabel(" • ".join(metadata_row1), self)
-            self.metadata_label1.setStyleSheet(f"color: {Theme.TEXT_MUTED}; font-size: 8pt;")
-            info_layout.addWidget(self.metadata_label1)
-        
-        if metadata_row2:
-            self.metadata_label2 = QLabel(" • ".join(metadata_row2), self)
-            self.metadata_label2.setStyleSheet(f"color: {Theme.TEXT_MUTED}; font-size: 8pt;")
-            info_layout.addWidget(self.metadata_label2)
+        for metadata_row in (metadata_row1, metadata_row2):
+            if metadata_row:
+                self.text_lines.append((" • ".join(metadata_row), self.detail_font, Theme.TEXT_MUTED,
+                                        Qt.TextElideMode.ElideRight))
         
         # Tags display
-        tags = self.project_data.get("tags", [])
+        tags = get("tags", [])
         if tags and isinstance(tags, list):
-            tags_layout = QHBoxLayout()
-            tags_layout.setSpacing(4)
-            tags_label = QLabel("Tags:", self)
-            tags_label.setStyleSheet(f"color: {Theme.TEXT_MUTED}; font-size: 8pt;")
-            tags_layout.addWidget(tags_label)
-            
-            for tag in tags[:5]:  # Show max 5 tags
-                tag_label = QLabel(f"#{tag}", self)
-                tag_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {Theme.PRIMARY};
-                        color: white;
-                        padding: 2px 6px;
-                        border-radius: 3px;
-                        font-size: 7pt;
-                    }}
-                """)
-                tags_layout.addWidget(tag_label)
+            self.tags = tags[:self.MAX_TAGS]
+            self.hidden_tag_count = max(0, len(tags) - self.MAX_TAGS)
+        else:
+            self.tags = []
+            self.hidden_tag_count = 0
+    
+    @classmethod
+    def preload(cls, project_data: Dict[str, Any]):
+        """Prepare project_data's icon and display strings ahead of building its row.
+        
+        Meant for the project loader threads, so icon decoding and metadata formatting
+        happen off the GUI thread; the row then only converts the image to a pixmap
+        and reuses the cached strings.
+        """
+        _format_display_strings(project_data)
+        icon_path = project_data.get("icon_path")
+        if icon_path:
+            project_data["_icon_image"] = _load_icon_image(icon_path, cls.ICON_SIZE)
+    
+    @classmethod
+    def _get_fonts(cls) -> Dict[str, QFont]:
+        """Get the fonts shared by all rows, creating them on first use."""
+        if cls._shared_fonts is None:
+            base = QApplication.font()
             
-            if len(tags) > 5:
-                more_label = QLabel(f"+{len(tags) - 5}", self)
-                more_label.setStyleSheet(f"color: {Theme.TEXT_MUTED}; font-size: 7pt;")
-                tags_layout.addWidget(more_label)
+            def sized(point_size: int) -> QFont:
+                font = QFont(base)
+                font.setPointSize(point_size)
+                return font
             
-            tags_layout.addStretch()
-            info_layout.addLayout(tags_layout)
-        
-        info_layout.addStretch()
-        layout.addLayout(info_layout, 1)
+            name_font = sized(12)
+            name_font.setBold(True)
+            button_font = QFont(base)
+            button_font.setWeight(QFont.Weight.Medium)
+            placeholder_font = QFont(base)
+            placeholder_font.setPixelSize(24)
+            cls._shared_fonts = {
+                "name": name_font,
+                "package": sized(9),
+                "detail": sized(8),
+                "tag": sized(7),
+                "button": button_font,
+                "placeholder": placeholder_font,
+            }
+        return cls._shared_fonts
+    
+    @staticmethod
+    def _static_text(text: str, font: QFont) -> QStaticText:
+        """Lay out plain text once so repaints skip text shaping."""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), font)
+        return static_text
+    
+    @classmethod
+    def _get_button_labels(cls) -> Dict[str, QStaticText]:
+        """Get the action button labels shared by all rows, laying them out on first use."""
+        if cls._shared_button_labels is None:
+            button_font = cls._get_fonts()["button"]
+            cls._shared_button_labels = {action: cls._static_text(text, button_font)
+                                         for action, text, _ in cls.ACTION_BUTTONS}
+        return cls._shared_button_labels
+    
+    def _get_static_lines(self, width: int) -> List[QStaticText]:
+        """Get the elided info lines for a column width, laid out once per width."""
+        if width != self._static_lines_width:
+            self._static_lines = [
+                self._static_text(QFontMetrics(font).elidedText(text, elide_mode, width), font)
+                for text, font, _, elide_mode in self.text_lines
+            ]
+            self._static_lines_width = width
+        return self._static_lines
+    
+    def _init_ui(self):
+        """Initialize UI components."""
+        # Everything, including the action buttons, is painted (see paintEvent),
+        # so a row has no child widgets to construct, lay out or style.
+        # Info lines are elided rather than wrapped, so the height doesn't depend on width
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self.setMouseTracking(True)
         
         # Right side - Action buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(8)
-        
-        self.run_btn = QPushButton("▶ Run", self)
-        self.run_btn.setMinimumWidth(90)
-        self.run_btn.setMaximumWidth(90)
-        self.run_btn.clicked.connect(lambda: self.run_clicked.emit(self.project_path))
-        self.run_btn.setToolTip("Run this Flutter project")
-        button_layout.addWidget(self.run_btn)
-        
-        self.open_btn = QPushButton("📂 Open", self)
-        self.open_btn.setMinimumWidth(90)
-        self.open_btn.setMaximumWidth(90)
-        self.open_btn.clicked.connect(lambda: self.open_clicked.emit(self.project_path))
-        self.open_btn.setToolTip("Open project folder")
-        button_layout.addWidget(self.open_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # Style - use theme
-        self.setStyleSheet(Theme.get_project_item_stylesheet())
+        self.button_font = self._get_fonts()["button"]
+        self._hovered_action: Optional[str] = None
+        self._pressed_action: Optional[str] = None
+        
+        # Keyboard access: Tab moves through the painted buttons, Space/Enter triggers one
+        self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
+        self._focused_action: Optional[str] = None
+        self.setAccessibleName(self.text_lines[0][0])
+        self.setAccessibleDescription(self.project_path)
+        
+        # Styling comes from Theme.get_project_item_stylesheet(), installed once on the
+        # containing list so rows don't each parse their own stylesheet
+    
+    def _buttons_width(self) -> int:
+        """Get the width taken by the action buttons."""
+        count = len(self.ACTION_BUTTONS)
+        return count * self.BUTTON_WIDTH + (count - 1) * self.BUTTON_SPACING
+    
+    def _buttons_height(self) -> int:
+        """Get the height of the action buttons."""
+        return QFontMetrics(self.button_font).height() + 2 * (self.BUTTON_PADDING_Y + 1)
+    
+    def _button_rects(self) -> Dict[str, QRect]:
+        """Get action button rectangles: right-aligned and vertically centered."""
+        height = self._buttons_height()
+        x = self.width() - self.MARGIN_X - self._buttons_width()
+        y = (self.height() - height) // 2
+        rects = {}
+        for action, _, _ in self.ACTION_BUTTONS:
+            rects[action] = QRect(x, y, self.BUTTON_WIDTH, height)
+            x += self.BUTTON_WIDTH + self.BUTTON_SPACING
+        return rects
+    
+    def _action_at(self, pos) -> Optional[str]:
+        """Get the action button under the given position, if any."""
+        for action, rect in self._button_rects().items():
+            if rect.contains(pos):
+                return action
+        return None
+    
+    def _emit_action(self, action: str):
+        """Emit the <action>_clicked signal for this project."""
+        getattr(self, f"{action}_clicked").emit(self.project_path)
+    
+    def _text_width(self, width: int) -> int:
+        """Get the width of the info column for a row of the given width."""
+        fixed = 2 * self.MARGIN_X + self.ICON_CONTAINER_SIZE + 2 * self.SPACING
+        return max(0, width - fixed - self._buttons_width())
+    
+    def _tag_pill_height(self) -> int:
+        """Get the height of a tag pill."""
+        return QFontMetrics(self.tag_font).height() + 2 * self.TAG_PADDING_Y
+    
+    def _tags_row_height(self) -> int:
+        """Get the height of the tags row."""
+        return max(self._tag_pill_height(), QFontMetrics(self.detail_font).height())
+    
+    def _content_height(self) -> int:
+        """Get the height of the info column."""
+        heights = [QFontMetrics(font).height() for _, font, _, _ in self.text_lines]
+        if self.tags:
+            heights.append(self._tags_row_height())
+        return sum(heights) + self.LINE_SPACING * (len(heights) - 1)
+    
+    def _row_height(self) -> int:
+        """Get the row height, which is the same at every width."""
+        content_height = max(self._content_height(), self.ICON_CONTAINER_SIZE, self._buttons_height())
+        return content_height + 2 * self.MARGIN_Y
+    
+    def sizeHint(self) -> QSize:
+        """Get preferred row size."""
+        width = (2 * self.MARGIN_X + self.ICON_CONTAINER_SIZE + 2 * self.SPACING
+                 + self.TEXT_WIDTH_HINT + self._buttons_width())
+        return QSize(width, self._row_height())
+    
+    def minimumSizeHint(self) -> QSize:
+        """Get minimum row size: icon and buttons without info column."""
+        width = 2 * self.MARGIN_X + self.ICON_CONTAINER_SIZE + 2 * self.SPACING + self._buttons_width()
+        return QSize(width, self._row_height())
+    
+    def enterEvent(self, event):
+        """Repaint with hover styling."""
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        """Repaint without hover styling."""
+        self._hovered = False
+        self._hovered_action = None
+        self.update()
+        super().leaveEvent(event)
+    
+    def mouseMoveEvent(self, event):
+        """Track which action button is hovered."""
+        action = self._action_at(event.position().toPoint())
+        if action != self._hovered_action:
+            self._hovered_action = action
+            self.update()
+        super().mouseMoveEvent(event)
+    
+    def event(self, event):
+        """Show tooltips for the painted action buttons, and the full path elsewhere."""
+        if event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(event.pos())
+            tooltips = {action: tooltip for action, _, tooltip in self.ACTION_BUTTONS}
+            if action:
+                QToolTip.showText(event.globalPos(), tooltips[action], self)
+            elif self.project_path:
+                # The painted path line is elided
+                QToolTip.showText(event.globalPos(), self.project_path, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+    
+    def paintEvent(self, event):
+        """Paint the card background and buttons live over the cached icon and text layer."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card background and border from the project item stylesheet
+        option = QStyleOption()
+        option.initFrom(self)
+        if self._hovered:
+            option.state |= QStyle.StateFlag.State_MouseOver
+        else:
+            option.state &= ~QStyle.StateFlag.State_MouseOver
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+        
+        # Only size changes invalidate the layer; hover, press and focus don't touch it
+        key = (self.width(), self.height(), self.devicePixelRatioF())
+        layer = None
+        if self._cache is not None and self._cache_key == key:
+            layer = QPixmapCache.find(self._cache)
+        if layer is None:
+            layer = self._rebuild_cache()
+            self._cache_key = key
+        painter.drawPixmap(0, 0, layer)
+        
+        self._paint_buttons(painter)
+        painter.end()
+    
+    def _rebuild_cache(self) -> QPixmap:
+        """Render the icon and info column into a pixmap held by QPixmapCache."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self._paint_icon(painter)
+        self._paint_info(painter)
+        painter.end()
+        
+        # QPixmapCache bounds the memory held by all rows' layers and evicts under pressure
+        self._release_cache()
+        self._cache = QPixmapCache.insert(pixmap)
+        return pixmap
+    
+    def _release_cache(self):
+        """Drop this row's cached icon and text layer."""
+        if self._cache is not None:
+            QPixmapCache.remove(self._cache)
+            self._cache = None
+            self._cache_key = None
+    
+    def hideEvent(self, event):
+        """Free the cached layer while the row is hidden."""
+        self._release_cache()
+        super().hideEvent(event)
+    
+    def _paint_icon(self, painter: QPainter):
+        """Paint the project icon, or a placeholder, inside a round border."""
+        size = self.ICON_CONTAINER_SIZE
+        rect = QRectF(self.MARGIN_X, (self.height() - size) / 2, size, size)
+        
+        border_color = Theme.PRIMARY if self.icon_pixmap is not None else Theme.BORDER
+        half_pen = self.ICON_BORDER_WIDTH / 2
+        painter.setPen(QPen(QColor(border_color), self.ICON_BORDER_WIDTH))
+        painter.setBrush(QColor(Theme.SURFACE))
+        painter.drawEllipse(rect.adjusted(half_pen, half_pen, -half_pen, -half_pen))
+        
+        if self.icon_pixmap is not None:
+            icon_size = self.icon_pixmap.deviceIndependentSize()
+            painter.drawPixmap(QPointF(rect.center().x() - icon_size.width() / 2,
+                                       rect.center().y() - icon_size.height() / 2), self.icon_pixmap)
+        else:
+            painter.setFont(self._get_fonts()["placeholder"])
+            painter.setPen(QColor(Theme.TEXT_PRIMARY))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "📱")
+    
+    def _paint_info(self, painter: QPainter):
+        """Paint the info column: name, package, path, metadata and tags."""
+        x = self.MARGIN_X + self.ICON_CONTAINER_SIZE + self.SPACING
+        y = self.MARGIN_Y
+        width = self._text_width(self.width())
+        painter.save()
+        painter.setClipRect(QRect(x, 0, width, self.height()))
+        
+        static_lines = self._get_static_lines(width)
+        for (_, font, color, _), static_text in zip(self.text_lines, static_lines):
+            height = QFontMetrics(font).height()
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            painter.drawStaticText(QPointF(x, y + (height - static_text.size().height()) / 2), static_text)
+            y += height + self.LINE_SPACING
+        
+        if self.tags:
+            self._paint_tags(painter, x, y)
+        painter.restore()
+    
+    def _paint_tags(self, painter: QPainter, x: int, y: int):
+        """Paint the tags row as rounded pills."""
+        row_height = self._tags_row_height()
+        
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(Theme.TEXT_MUTED))
+        label_width = QFontMetrics(self.detail_font).horizontalAdvance("Tags:")
+        painter.drawText(QRect(x, y, label_width, row_height), self.LINE_FLAGS, "Tags:")
+        x += label_width + self.TAG_SPACING
+        
+        ratio = painter.device().devicePixelRatioF()
+        for tag in self.tags:
+            pill = self._get_tag_pill(f"#{tag}", ratio)
+            pill_size = pill.deviceIndependentSize()
+            painter.drawPixmap(QPointF(x, y + (row_height - pill_size.height()) / 2), pill)
+            x += pill_size.width() + self.TAG_SPACING
+        
+        if self.hidden_tag_count:
+            text = f"+{self.hidden_tag_count}"
+            painter.setFont(self.tag_font)
+            painter.drawText(QRectF(x, y, QFontMetrics(self.tag_font).horizontalAdvance(text), row_height),
+                             self.LINE_FLAGS, text)
+    
+    def _get_tag_pill(self, text: str, ratio: float) -> QPixmap:
+        """Get a rendered tag pill, shared between rows via QPixmapCache."""
+        key = f"project_tag:{text}:{ratio}"
+        pill = QPixmapCache.find(key)
+        if pill is None:
+            width = QFontMetrics(self.tag_font).horizontalAdvance(text) + 2 * self.TAG_PADDING_X
+            height = self._tag_pill_height()
+            pill = QPixmap(round(width * ratio), round(height * ratio))
+            pill.setDevicePixelRatio(ratio)
+            pill.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pill)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(Theme.PRIMARY))
+            painter.drawRoundedRect(QRectF(0, 0, width, height), 3, 3)
+            painter.setFont(self.tag_font)
+            painter.setPen(QColor("white"))
+            painter.drawText(QRectF(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
+            QPixmapCache.insert(key, pill)
+        return pill
+    
+    def _paint_buttons(self, painter: QPainter):
+        """Paint the action buttons."""
+        if Theme.BACKGROUND:
+            normal_background = QColor(Theme.BACKGROUND)
+        else:
+            normal_background = self.palette().color(QPalette.ColorRole.Window)
+        button_rects = self._button_rects()
+        button_labels = self._get_button_labels()
+        painter.setFont(self.button_font)
+        for action, _, _ in self.ACTION_BUTTONS:
+            rect = QRectF(button_rects[action]).adjusted(0.5, 0.5, -0.5, -0.5)
+            if action == self._pressed_action:
+                border, background, foreground = QColor(Theme.ACCENT), QColor(Theme.ACCENT), QColor("white")
+            elif action == self._hovered_action:
+                border, background, foreground = QColor(Theme.PRIMARY), QColor(Theme.PRIMARY), QColor("white")
+            else:
+                border, background, foreground = QColor(Theme.BORDER), normal_background, QColor(Theme.TEXT_PRIMARY)
+            painter.setPen(QPen(border, 1))
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, 4, 4)
+            if action == self._focused_action:
+                # Keyboard focus ring
+                painter.setPen(QPen(QColor(Theme.PRIMARY), 2))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRoundedRect(rect.adjusted(-2, -2, 2, 2), 5, 5)
+            painter.setPen(foreground)
+            label = button_labels[action]
+            label_size = label.size()
+            painter.drawStaticText(QPointF(rect.center().x() - label_size.width() / 2,
+                                           rect.center().y() - label_size.height() / 2), label)
     
     def mousePressEvent(self, event):
         """Handle mouse click on item."""
         if event.button() == Qt.MouseButton.LeftButton:
+            action = self._action_at(event.position().toPoint())
+            if action:
+                self._pressed_action = action
+                self.update()
+                return
             self.clicked.emit(self.project_path)
         super().mousePressEvent(event)
     
+    def mouseReleaseEvent(self, event):
+        """Trigger an action button when released over it."""
+        if self._pressed_action and event.button() == Qt.MouseButton.LeftButton:
+            action = self._pressed_action
+            self._pressed_action = None
+            self.update()
+            if self._action_at(event.position().toPoint()) == action:
+                self._emit_action(action)
+            return
+        super().mouseReleaseEvent(event)
+    
+    def _set_focused_action(self, action: Optional[str]):
+        """Move keyboard focus between painted buttons; the row's accessible name follows it."""
+        if action == self._focused_action:
+            return
+        self._focused_action = action
+        tooltips = {name: tooltip for name, _, tooltip in self.ACTION_BUTTONS}
+        self.setAccessibleName(tooltips[action] if action else self.text_lines[0][0])
+        self.update()
+    
+    def focusInEvent(self, event):
+        """Focus the first button on Tab, the last on Shift+Tab."""
+        if event.reason() == Qt.FocusReason.TabFocusReason:
+            self._set_focused_action(self.ACTION_BUTTONS[0][0])
+        elif event.reason() == Qt.FocusReason.BacktabFocusReason:
+            self._set_focused_action(self.ACTION_BUTTONS[-1][0])
+        super().focusInEvent(event)
+    
+    def focusOutEvent(self, event):
+        """Drop the button focus ring."""
+        self._set_focused_action(None)
+        super().focusOutEvent(event)
+    
+    def focusNextPrevChild(self, next: bool) -> bool:
+        """Tab through the painted buttons before leaving the row."""
+        actions = [action for action, _, _ in self.ACTION_BUTTONS]
+        if self._focused_action in actions:
+            index = actions.index(self._focused_action) + (1 if next else -1)
+            if 0 <= index < len(actions):
+                self._set_focused_action(actions[index])
+                return True
+        return super().focusNextPrevChild(next)
+    
+    def keyPressEvent(self, event):
+        """Trigger the focused button, or the row itself, with Space/Enter."""
+        if event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            if self._focused_action:
+                self._emit_action(self._focused_action)
+            else:
+                self.clicked.emit(self.project_path)
+            return
+        super().keyPressEvent(event)
+    
     def contextMenuEvent(self, event):
         """Handle right-click context menu."""
-        menu = QMenu(self)
-        
-        # Run Project
-        run_action = menu.addAction("▶ Run Project")
-        run_action.triggered.connect(lambda: self.run_clicked.emit(self.project_path))
-        
-        menu.addSeparator()
-        
-        # Open actions
-        open_folder_action = menu.addAction("📂 Open Folder")
-        open_folder_action.triggered.connect(lambda: self.open_clicked.emit(self.project_path))
-        
-        open_vscode_action = menu.addAction("📝 Open in VS Code")
-        open_vscode_action.triggered.connect(lambda: self.open_vscode_clicked.emit(self.project_path))
-        
-        open_as_action = menu.addAction("🛠 Open in Android Studio")
-        open_as_action.triggered.connect(lambda: self.open_android_studio_clicked.emit(self.project_path))
-        
-        menu.addSeparator()
-        
-        # Build actions
-        build_apk_action = menu.addAction("📦 Build APK")
-        build_apk_action.triggered.connect(lambda: self.build_apk_clicked.emit(self.project_path))
-        
-        build_bundle_action = menu.addAction("🎁 Build Bundle")
-        build_bundle_action.triggered.connect(lambda: self.build_bundle_clicked.emit(self.project_path))
-        
-        menu.addSeparator()
-        
-        # Project actions
-        view_details_action = menu.addAction("ℹ️ View Details")
-        view_details_action.triggered.connect(lambda: self.view_details_clicked.emit(self.project_path))
-        
-        manage_tags_action = menu.addAction("🏷️ Manage Tags")
-        manage_tags_action.triggered.connect(lambda: self.manage_tags_clicked.emit(self.project_path))
-        
-        menu.addSeparator()
-        
-        # Utility actions
-        copy_path_action = menu.addAction("📋 Copy Path")
-        copy_path_action.triggered.connect(lambda: self.copy_path_clicked.emit(self.project_path))
-        
-        remove_action = menu.addAction("🗑️ Remove from List")
-        remove_action.triggered.connect(lambda: self.remove_from_list_clicked.emit(self.project_path))
+        if self._context_menu is None:
+            self._context_menu = self._create_context_menu()
         
         # Show menu at cursor position
-        menu.exec(event.globalPos())
+        self._context_menu.exec(event.globalPos())
+    
+    def _create_context_menu(self) -> QMenu:
+        """Build the context menu, reused for every right-click on this row."""
+        menu = QMenu(self)
+        for entry in self.CONTEXT_MENU_ACTIONS:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            action_name, text = entry
+            menu.addAction(text).setData(action_name)
+        # One connection for the whole menu; the action carries its signal name
+        menu.triggered.connect(self._on_menu_triggered)
+        return menu
+    
+    def _on_menu_triggered(self, action):
+        """Emit the signal for a context menu action."""
+        self._emit_action(action.data())
 
 
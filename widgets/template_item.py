@@ -1,8 +1,39 @@
 """Template item widget for Flutter Project Launcher Tool."""
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from typing import Dict, Any, Optional
+import html
+from PyQt6.QtWidgets import QWidget, QLayout, QLabel, QStyle, QStyleOption
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF
+from PyQt6.QtGui import QFont, QPixmap, QPixmapCache, QPainter, QPen, QColor
+from typing import Dict, Any, List, Optional, Tuple
+
+# Badge colors per template type
+_BADGE_COLOR_BY_TYPE = {"builtin": "#0078d4"}
+_BADGE_COLOR_DEFAULT = "#28a745"
+
+# Card text as one rich-text label; name and description must be HTML-escaped
+_CARD_HTML = (
+    '<div align="center" style="font-size: 12pt; font-weight: bold;">{name}</div>'
+    '<div align="center" style="margin-top: 8px; color: #666; font-size: 9pt;">{description}</div>'
+    '<table width="100%" cellspacing="0" cellpadding="2" style="margin-top: 8px;"><tr>'
+    '<td align="center" bgcolor="{badge_color}" style="color: white; font-size: 8pt;">{type_label}</td>'
+    '</tr></table>'
+)
+
+_type_labels: Dict[str, str] = {}  # Badge text per template type, see _type_label()
+
+
+def _type_label(template_type: str) -> str:
+    """Get the badge text for a template type, upper-casing each type only once."""
+    label = _type_labels.get(template_type)
+    if label is None:
+        label = _type_labels[template_type] = template_type.upper()
+    return label
+
+
+def _unpack_template(template_data: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Read (id, name, description, type) from a template dict, with display defaults."""
+    get = template_data.get
+    return (get("id", ""), get("name", "Unknown Template"),
+            get("description", "No description"), get("type", "unknown"))
 
 
 class TemplateItem(QWidget):
@@ -11,93 +42,197 @@ class TemplateItem(QWidget):
     # Signals
     selected = pyqtSignal(str)  # template_id
     
+    # Released cards kept for reuse, see acquire()/release()
+    POOL_LIMIT = 32
+    _pool: List["TemplateItem"] = []
+    
+    _shared_button_font = None  # Built once per process, see _get_button_font()
+    
+    # Card geometry, laid out by hand in _fit_to_text(); taller than MIN_HEIGHT only for long text
+    CARD_WIDTH = 220
+    MIN_HEIGHT = 180
+    MARGIN = 15
+    SPACING = 8
+    
+    # Painted "Select" affordance; the whole card is clickable
+    SELECT_BUTTON_HEIGHT = 28
+    SELECT_BUTTON_COLOR = "#0078d4"
+    SELECT_BUTTON_HOVER_COLOR = "#005a9e"
+    
     def __init__(self, template_data: Dict[str, Any], parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.template_data = template_data
-        self.template_id = template_data.get("id", "")
+        self._hovered = False
         self._init_ui()
+        self.rebind(template_data)
     
-    def _init_ui(self):
-        """Initialize UI components."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(8)
-        
-        # Template name
-        self.name_label = QLabel(self.template_data.get("name", "Unknown Template"), self)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_font.setPointSize(12)
-        self.name_label.setFont(name_font)
-        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.name_label)
-        
-        # Template description
-        description = self.template_data.get("description", "No description")
-        self.desc_label = QLabel(description, self)
-        self.desc_label.setWordWrap(True)
-        self.desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.desc_label.setStyleSheet("color: #666; font-size: 9pt;")
-        layout.addWidget(self.desc_label)
+    @classmethod
+    def acquire(cls, template_data: Dict[str, Any], parent: Optional[QWidget] = None) -> "TemplateItem":
+        """Get a card for template_data, reusing a released one when available."""
+        if not cls._pool:
+            return cls(template_data, parent)
+        item = cls._pool.pop()
+        item.setParent(parent)
+        item.rebind(template_data)
+        if parent is not None:
+            item.show()  # Hidden by release(); a parentless card stays hidden, like a new one
+        return item
+    
+    @classmethod
+    def build_many(cls, parent_layout: QLayout, template_dicts: List[Dict[str, Any]]) -> List["TemplateItem"]:
+        """Create cards for template_dicts and add them to parent_layout in one batch.
         
-        # Template type badge
-        template_type = self.template_data.get("type", "unknown")
-        type_label = QLabel(template_type.upper(), self)
-        type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if template_type == "builtin":
-            type_label.setStyleSheet("""
-                background-color: #0078d4;
-                color: white;
-                padding: 2px 8px;
-                border-radius: 10px;
-                font-size: 8pt;
-            """)
+        Updates are suspended while building, so the container is laid out and
+        repainted once instead of after every card.
+        """
+        parent = parent_layout.parentWidget()
+        updates_enabled = parent is None or parent.updatesEnabled()
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            # Create everything first, then insert, so the layout is only touched in one pass
+            items = [cls.acquire(template_data, parent) for template_data in template_dicts]
+            for item in items:
+                parent_layout.addWidget(item)
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(updates_enabled)
+                parent.updateGeometry()
+        return items
+    
+    def release(self):
+        """Detach this card and return it to the pool instead of destroying it."""
+        try:
+            self.selected.disconnect()
+        except TypeError:
+            pass  # No receivers connected
+        self.hide()
+        self.setParent(None)
+        self._hovered = False
+        if len(self._pool) < self.POOL_LIMIT:
+            self._pool.append(self)
         else:
-            type_label.setStyleSheet("""
-                background-color: #28a745;
-                color: white;
-                padding: 2px 8px;
-                border-radius: 10px;
-                font-size: 8pt;
-            """)
-        layout.addWidget(type_label)
-        
-        layout.addStretch()
+            self.deleteLater()
+    
+    @classmethod
+    def _get_button_font(cls) -> QFont:
+        """Get the select button font shared by all cards, creating it on first use."""
+        if cls._shared_button_font is None:
+            cls._shared_button_font = QFont()
+            cls._shared_button_font.setBold(True)
+        return cls._shared_button_font
+    
+    def _init_ui(self):
+        """Initialize UI components."""
+        # Template name, description and type badge, above the painted select button
+        self.text_label = QLabel(self)
+        self.text_label.setTextFormat(Qt.TextFormat.RichText)
+        self.text_label.setWordWrap(True)
+        self.text_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         
-        # Select button
-        self.select_btn = QPushButton("Select", self)
-        self.select_btn.clicked.connect(lambda: self.selected.emit(self.template_id))
-        layout.addWidget(self.select_btn)
+        # Keyboard access: Tab reaches the card, Space/Enter selects it
+        self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
         
-        # Style
-        self.setStyleSheet("""
-            TemplateItem {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-                min-height: 150px;
-            }
-            TemplateItem:hover {
-                border-color: #0078d4;
-                background-color: #f8f9fa;
-            }
-            QPushButton {
-                padding: 6px;
-                border: 1px solid #0078d4;
-                border-radius: 4px;
-                background-color: #0078d4;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-        """)
+        # Card border styling comes from Theme.get_template_item_stylesheet(), installed
+        # once on the application rather than parsed again for every card
+    
+    def rebind(self, template_data: Dict[str, Any]):
+        """Show template_data on this card."""
+        self.template_data = template_data
+        self.template_id, name, description, template_type = _unpack_template(template_data)
+        self.text_label.setText(_CARD_HTML.format(
+            name=html.escape(name), description=html.escape(description),
+            type_label=html.escape(_type_label(template_type)),
+            badge_color=_BADGE_COLOR_BY_TYPE.get(template_type, _BADGE_COLOR_DEFAULT)))
+        self.setAccessibleName(name)
+        self.setAccessibleDescription(description)
+        self._fit_to_text()
+    
+    def _fit_to_text(self):
+        """Size the card so the wrapped text and badge fit above the select button."""
+        text_width = self.CARD_WIDTH - 2 * self.MARGIN
+        self.text_label.ensurePolished()
+        text_height = self.text_label.heightForWidth(text_width)
+        self.text_label.setGeometry(self.MARGIN, self.MARGIN, text_width, text_height)
+        height = 2 * self.MARGIN + text_height + self.SPACING + self.SELECT_BUTTON_HEIGHT
+        self.setFixedSize(self.CARD_WIDTH, max(self.MIN_HEIGHT, height))
     
     def mousePressEvent(self, event):
         """Handle mouse click on item."""
         if event.button() == Qt.MouseButton.LeftButton:
             self.selected.emit(self.template_id)
         super().mousePressEvent(event)
+    
+    def keyPressEvent(self, event):
+        """Select the template with Space/Enter."""
+        if event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.selected.emit(self.template_id)
+            return
+        super().keyPressEvent(event)
+    
+    def focusInEvent(self, event):
+        """Repaint with the focus ring."""
+        self.update()
+        super().focusInEvent(event)
+    
+    def focusOutEvent(self, event):
+        """Repaint without the focus ring."""
+        self.update()
+        super().focusOutEvent(event)
+    
+    def enterEvent(self, event):
+        """Repaint with hover styling."""
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        """Repaint without hover styling."""
+        self._hovered = False
+        self.update()
+        super().leaveEvent(event)
+    
+    def paintEvent(self, event):
+        """Blit the card background; the labels paint themselves on top."""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._get_background(self.devicePixelRatioF()))
+        painter.end()
+    
+    def _get_background(self, ratio: float) -> QPixmap:
+        """Get the rendered card background and select button, shared between same-sized cards via QPixmapCache."""
+        focused = self.hasFocus()
+        key = f"template_card:{self.width()}x{self.height()}:{self._hovered}:{focused}:{ratio}"
+        background = QPixmapCache.find(key)
+        if background is None:
+            background = QPixmap(max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+            background.setDevicePixelRatio(ratio)
+            background.fill(Qt.GlobalColor.transparent)
+            
+            # Card background and border from the template item stylesheet
+            painter = QPainter(background)
+            option = QStyleOption()
+            option.initFrom(self)
+            if self._hovered:
+                option.state |= QStyle.StateFlag.State_MouseOver
+            else:
+                option.state &= ~QStyle.StateFlag.State_MouseOver
+            self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+            
+            button_rect = QRectF(self.MARGIN, self.height() - self.MARGIN - self.SELECT_BUTTON_HEIGHT,
+                                 self.width() - 2 * self.MARGIN, self.SELECT_BUTTON_HEIGHT)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(self.SELECT_BUTTON_HOVER_COLOR if self._hovered else self.SELECT_BUTTON_COLOR))
+            painter.drawRoundedRect(button_rect, 4, 4)
+            if focused:
+                # Keyboard focus ring
+                painter.setPen(QPen(QColor(self.SELECT_BUTTON_HOVER_COLOR), 2))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRoundedRect(button_rect.adjusted(-2, -2, 2, 2), 5, 5)
+            painter.setFont(self._get_button_font())
+            painter.setPen(QColor("white"))
+            painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, "Select")
+            painter.end()
+            QPixmapCache.insert(key, background)
+        return background
 
 